@@ -15,6 +15,7 @@ Key Steps:
 
 # Import necessary libraries
 import pandas as pd
+import numpy as np
 
 # =============================================================================
 # 1. LOAD FINAL SCORED DATA
@@ -36,22 +37,15 @@ except FileNotFoundError:
 median_nugas = df_scores['Nugas_Score_Normalized'].median()
 median_nongkrong = df_scores['Nongkrong_Score_Normalized'].median()
 
-def assign_segment(row):
-    """Assigns a segment label to a coffee shop based on its scores."""
-    is_nugas_high = row['Nugas_Score_Normalized'] >= median_nugas
-    is_nongkrong_high = row['Nongkrong_Score_Normalized'] >= median_nongkrong
-
-    if is_nugas_high and is_nongkrong_high:
-        return 'All-Rounder'
-    elif is_nugas_high and not is_nongkrong_high:
-        return 'Productivity Hub'
-    elif not is_nugas_high and is_nongkrong_high:
-        return 'Social Hotspot'
-    else:
-        return 'General Purpose'
-
-# Apply the classification function to create the 'Segment' column.
-df_scores['Segment'] = df_scores.apply(assign_segment, axis=1)
+# Assign a segment label to each coffee shop based on its scores. The two
+# vectorized comparisons form a 2-bit code that indexes a 4-label table,
+# avoiding a Python-level function call per row.
+is_nugas_high = (df_scores['Nugas_Score_Normalized'] >= median_nugas).to_numpy()
+is_nongkrong_high = (df_scores['Nongkrong_Score_Normalized'] >= median_nongkrong).to_numpy()
+
+segment_codes = is_nugas_high.astype(np.int8) * 2 + is_nongkrong_high.astype(np.int8)
+segment_labels = ['General Purpose', 'Social Hotspot', 'Productivity Hub', 'All-Rounder']
+df_scores['Segment'] = pd.Categorical.from_codes(segment_codes, categories=segment_labels)
 print("Coffee shops have been classified into segments.")
 
 # =============================================================================